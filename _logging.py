@@ -0,0 +1,161 @@
+"""Shared logging for send2jsm.py, the alert wrapper and send2jsmd.py."""
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Log levels, numerically the same as the logging module's
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+_LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+DEFAULT_LOG_PATH = "/var/log/jec/send2jsm.log"
+FALLBACK_LOG_PATH = "/tmp/send2jsm.log"
+
+class LogFile:
+    """Log file collecting lines in memory and appending them in batches.
+
+    Lines are appended with a single os.write() per batch: once 64 KiB have
+    accumulated, on ERROR (followed by an fsync), on close() and at
+    interpreter exit. The file is opened with O_APPEND, so batches from
+    concurrent processes don't overwrite each other. With no path, lines go
+    to stderr.
+    """
+
+    BUFFER_SIZE = 65536
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        if path:
+            self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        else:
+            self._fd = sys.stderr.fileno()
+        atexit.register(self.close)
+
+    def write(self, line: bytes, sync: bool = False) -> None:
+        with self._lock:
+            self._buf += line
+            if sync or len(self._buf) >= self.BUFFER_SIZE:
+                self._flush(sync)
+
+    def flush(self, sync: bool = False) -> None:
+        """Write out the buffered lines; with sync, also fsync the log file"""
+        with self._lock:
+            self._flush(sync)
+
+    def _flush(self, sync: bool = False) -> None:
+        if self._fd is None or not self._buf:
+            return
+        data = bytes(self._buf)
+        self._buf.clear()
+        written = 0
+        while written < len(data):
+            written += os.write(self._fd, data[written:])
+        if sync and self._path:
+            try:
+                os.fsync(self._fd)
+            except OSError:
+                pass  # e.g. os.devnull
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is None:
+                return
+            self._flush()
+            if self._path:
+                os.close(self._fd)
+            self._fd = None
+
+@functools.lru_cache(maxsize=None)
+def _open_log_file(path: Optional[str]) -> LogFile:
+    return LogFile(path)
+
+def configure_once(path: str = DEFAULT_LOG_PATH) -> LogFile:
+    """Return the process-wide log file for path, setting it up on first call.
+
+    Creates the log directory if needed and falls back to /tmp/send2jsm.log
+    (then to no logging) when path isn't writable. Cached, so the wrapper
+    and JSMClient share one file and the checks run once per process.
+    """
+    # Always pass path positionally so configure_once() and
+    # configure_once(DEFAULT_LOG_PATH) hit the same cache entry
+    return _configure(path)
+
+@functools.lru_cache(maxsize=None)
+def _configure(path: str) -> LogFile:
+    log_dir = os.path.dirname(path)
+    try:
+        # Check if directory exists and is writable
+        if not os.path.exists(log_dir):
+            Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+        if not os.access(log_dir, os.W_OK):
+            raise PermissionError(f"No write permission for log directory: {log_dir}")
+
+        return _open_log_file(path)
+    except Exception as e:
+        print(f"Could not create log file '{path}', will log to '{FALLBACK_LOG_PATH}'. Error: {e}", file=sys.stderr)
+        try:
+            return _open_log_file(FALLBACK_LOG_PATH)
+        except Exception as e:
+            print(f"Logging disabled. Reason: {e}", file=sys.stderr)
+            return _open_log_file(os.devnull)
+
+class FastLog:
+    """Minimal logger writing pre-formatted lines to a LogFile.
+
+    Stands in for the logging module: no LogRecord or handler chain per
+    call. Lines keep the old '<asctime> - <LEVEL> - <message>' layout,
+    behind an optional prefix. Without a log_file, lines go to stderr.
+    """
+
+    def __init__(self, log_file: Optional[LogFile] = None, level: int = WARNING, prefix: str = ""):
+        self.level = level
+        self._prefix = prefix
+        self._file = log_file if log_file is not None else _open_log_file(None)
+        # (second, asctime) of the last line, reformatted only when the second
+        # changes; one tuple so threads never see a mismatched pair
+        self._asctime_cache = (-1, "")
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self.level
+
+    def _log(self, level: int, msg: str, args: tuple) -> None:
+        if args:
+            msg = msg % args
+        now = time.time()
+        second = int(now)
+        last_second, asctime = self._asctime_cache
+        if second != last_second:
+            asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._asctime_cache = (second, asctime)
+        line = f"{self._prefix}{asctime},{int((now - second) * 1000):03d} - {_LEVEL_NAMES[level]} - {msg}\n"
+        self._file.write(line.encode(), sync=level >= ERROR)
+
+    def debug(self, msg: str, *args: Any) -> None:
+        if self.level <= DEBUG:
+            self._log(DEBUG, msg, args)
+
+    def info(self, msg: str, *args: Any) -> None:
+        if self.level <= INFO:
+            self._log(INFO, msg, args)
+
+    def warning(self, msg: str, *args: Any) -> None:
+        if self.level <= WARNING:
+            self._log(WARNING, msg, args)
+
+    def error(self, msg: str, *args: Any) -> None:
+        if self.level <= ERROR:
+            self._log(ERROR, msg, args)
+
+    def flush(self) -> None:
+        self._file.flush()
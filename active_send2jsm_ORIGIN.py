@@ -1,65 +1,100 @@
 # !/usr/bin/env python3
-import argparse
 import json
+import socket
 import sys
-import logging
-import os
-from send2jsm import JSMClient
+from typing import Dict
+from _logging import INFO, FastLog, configure_once
+from send2jsm import DAEMON_SOCKET_PATH, MAX_ALERT_SIZE, ConfigurationError, JSMClient, parse_options
 
-def setup_logging():
+def setup_logging() -> FastLog:
     """Configure logging"""
-    try:
-        os.makedirs('/var/log/jec', exist_ok=True)
-        logging.basicConfig(
-            filename='/var/log/jec/send2jsm.log',
-            level=logging.INFO,
-            format='[PYTHON WRAPPER] - %(asctime)s - %(levelname)s - %(message)s',
-        )
-    except Exception as e:
-        print(f"Warning: Could not set up logging: {e}", file=sys.stderr)
-        logging.basicConfig(
-            filename='/tmp/send2jsm.log',
-            level=logging.INFO,
-            format='[PYTHON WRAPPER] - %(asctime)s - %(levelname)s - %(message)s',
-        )
+    return FastLog(configure_once(), INFO, prefix='[PYTHON WRAPPER] - ')
+
+# Mapping of field names from Zabbix format to send2jsm format
+_FIELD_MAP = (
+    ('triggerName', 'eventName'),
+    ('triggerId', 'triggerId'),
+    ('triggerStatus', 'status'),
+    ('triggerSeverity', 'severity'),
+    ('triggerDescription', 'description'),
+    ('triggerUrl', 'url'),
+    ('triggerValue', 'value'),
+    ('triggerHostGroupName', 'hostGroup'),
+    ('hostName', 'hostName'),
+    ('ipAddress', 'ipAddress'),
+    ('eventId', 'eventId'),
+    ('date', 'date'),
+    ('time', 'time'),
+    ('itemKey', 'itemKey'),
+    ('itemValue', 'itemValue'),
+    ('recoveryEventStatus', 'recoveryStatus'),
+)
+
+# Every Zabbix field is a required --name value argument
+_ALERT_FIELDS = tuple(zabbix_key for zabbix_key, _ in _FIELD_MAP)
 
 def convert_to_send2jsm_format(data: Dict[str, str]) -> Dict[str, str]:
     """Convert the parsed data to the format expected by send2jsm.py"""
-    # Mapping of field names from Zabbix format to send2jsm format
-    field_mapping = {
-        'triggerName': 'eventName',
-        'triggerId': 'triggerId',
-        'triggerStatus': 'status',
-        'triggerSeverity': 'severity',
-        'triggerDescription': 'description',
-        'triggerUrl': 'url',
-        'triggerValue': 'value',
-        'triggerHostGroupName': 'hostGroup',
-        'hostName': 'hostName',
-        'ipAddress': 'ipAddress',
-        'eventId': 'eventId',
-        'date': 'date',
-        'time': 'time',
-        'itemKey': 'itemKey',
-        'itemValue': 'itemValue',
-        'recoveryEventStatus': 'recoveryStatus'
-    }
-
-    converted_data = {}
-    for zabbix_key, send2jsm_key in field_mapping.items():
-        if zabbix_key in data:
-            converted_data[send2jsm_key] = data[zabbix_key]
-
-    return converted_data
-
-
-def send_alert(alert_data):
+    return {send2jsm_key: data[zabbix_key] for zabbix_key, send2jsm_key in _FIELD_MAP if zabbix_key in data}
+
+
+def send_via_daemon(alert_data):
     """
-    Sends an alert using JSMClient
+    Hands an alert to a running send2jsmd
 
     Args:
         alert_data (dict): Dictionary containing alert data
+
+    Returns:
+        bool: True if the daemon queued the alert, False if it isn't running,
+            the alert is too big for it or it rejected the alert
+
+    Raises:
+        OSError: If the alert was handed over but neither acknowledged nor
+            rejected; the daemon may still send it, so it must not be sent
+            again directly
+    """
+    payload = json.dumps(alert_data).encode()
+    if len(payload) > MAX_ALERT_SIZE:
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET) as sock:
+        sock.settimeout(5)
+        try:
+            sock.connect(DAEMON_SOCKET_PATH)
+            sock.send(payload)
+        except OSError:
+            return False
+        reply = sock.recv(64)
+        if reply == b"ERR":
+            return False
+        if reply != b"OK":
+            raise ConnectionError("send2jsmd did not acknowledge the alert")
+        return True
+
+
+def send_alert(alert_data, logger):
     """
+    Sends an alert through send2jsmd, or directly using JSMClient if the
+    daemon is not running
+
+    Args:
+        alert_data (dict): Dictionary containing alert data
+        logger (FastLog): Wrapper logger from setup_logging()
+    """
+    logger.info("Received alert for trigger %s on %s", alert_data['triggerId'], alert_data['hostName'])
+    try:
+        if send_via_daemon(alert_data):
+            logger.info("Alert for trigger %s handed to send2jsmd", alert_data['triggerId'])
+            print("\nAlert queued for sending!")
+            return
+    except OSError as e:
+        logger.error("send2jsmd did not take alert for trigger %s: %s", alert_data['triggerId'], e)
+        print(f"Error sending alert: {e}")
+        sys.exit(1)
+
+    logger.info("send2jsmd did not take alert for trigger %s; sending it directly", alert_data['triggerId'])
+
     try:
         # Create JSM client
         client = JSMClient()
@@ -72,56 +107,25 @@ def send_alert(alert_data):
 
         print("\nAlert sent successfully!")
 
+    except ConfigurationError as e:
+        logger.error("Configuration error: %s", e)
+        print(f"Configuration error: {e}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
+        logger.error("Error sending alert: %s", e)
         print(f"Error sending alert: {e}")
         sys.exit(1)
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Send alert to JSM')
-
-    # Add arguments for alert data
-    parser.add_argument('--triggerName', required=True, help='Trigger Name')
-    parser.add_argument('--triggerId', required=True, help='Trigger ID')
-    parser.add_argument('--triggerStatus', required=True, help='Trigger Status')
-    parser.add_argument('--triggerSeverity', required=True, help='Trigger Severity')
-    parser.add_argument('--triggerDescription', required=True, help='Trigger Description')
-    parser.add_argument('--triggerUrl', required=True, help='Trigger Url')
-    parser.add_argument('--triggerValue', required=True, help='Trigger Value')
-    parser.add_argument('--triggerHostGroupName', required=True, help='Trigger HostGroupName')
-    parser.add_argument('--hostName', required=True, help='Host name')
-    parser.add_argument('--ipAddress', required=True, help='ipAddress')
-    parser.add_argument('--eventId', required=True, help='eventId')
-    parser.add_argument('--date', required=True, help='date')
-    parser.add_argument('--time', required=True, help='time')
-    parser.add_argument('--itemKey', required=True, help='itemKey')
-    parser.add_argument('--itemValue', required=True, help='itemValue')
-    parser.add_argument('--recoveryEventStatus', required=True, help='recoveryEventStatus')
-
-    args = parser.parse_args()
+    logger = setup_logging()
+    options = parse_options(sys.argv[1:], _ALERT_FIELDS, required=_ALERT_FIELDS)
 
     # Create dictionary with alert data
-    alert_data = {
-        'triggerName': args.triggerName,
-        'triggerId': args.triggerId,
-        'triggerStatus': args.triggerStatus,
-        'triggerSeverity': args.triggerSeverity,
-        'triggerDescription': args.triggerDescription,
-        'triggerUrl': args.triggerUrl,
-        'triggerValue': args.triggerValue,
-        'triggerHostGroupName': args.triggerHostGroupName,
-        'hostName': args.hostName,
-        'ipAddress': args.ipAddress,
-        'eventId': args.eventId,
-        'date': args.date,
-        'time': args.time,
-        'itemKey': args.itemKey,
-        'itemValue': args.itemValue,
-        'recoveryEventStatus': args.recoveryEventStatus
-    }
+    alert_data = {key: options[key] for key in _ALERT_FIELDS}
 
     # Send the alert
-    send_alert(alert_data)
+    send_alert(alert_data, logger)
 
 if __name__ == "__main__":
     main()
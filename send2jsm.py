@@ -1,23 +1,25 @@
 #!/usr/bin/env python3
-import argparse
-import json
-import logging
+import atexit
+import collections
+import functools
 import os
+import pickle
 import re
+import string
 import sys
+import threading
 import time
-from typing import Dict, Optional, Any
-from urllib.parse import urlparse, urlunparse
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, Optional, Tuple, Any
+from urllib.parse import SplitResult, unquote, urlparse, urlsplit, urlunparse
 from pathlib import Path
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from urllib3.exceptions import InsecureRequestWarning
-from requests.exceptions import RequestException, Timeout, ConnectionError
+from _logging import DEBUG, INFO, WARNING, ERROR, DEFAULT_LOG_PATH, FastLog, configure_once
 
-# Suppress only the single warning from urllib3 needed.
-requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+# http.client/ssl (and json) are imported on first use, so --version and
+# configuration errors don't pay for them.
+if TYPE_CHECKING:
+    import http.client
+    from concurrent.futures import ThreadPoolExecutor
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -33,14 +35,81 @@ DEFAULT_CONFIG = {
     "timeout": "60"
 }
 
+# send_data makes up to MAX_ATTEMPTS posts, retrying on these statuses and
+# on connection errors
+MAX_ATTEMPTS = 3
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Unix socket the send2jsmd daemon accepts alerts on, and the largest
+# encoded alert it takes; bigger ones are sent directly
+DAEMON_SOCKET_PATH = "/run/send2jsmd.sock"
+MAX_ALERT_SIZE = 65536
+
+# Background sends (JSMClient.send_data_async) run on a pool of this many threads
+MAX_WORKERS = 4
+
+# Per-user cache of the merged integration.conf / jec-config.json settings
+CONFIG_CACHE_PATH = "/tmp/send2jsm.{uid}.cache"
+
 # Logging levels mapping
 LOG_LEVELS = {
-    "info": logging.INFO,
-    "debug": logging.DEBUG,
-    "warning": logging.WARNING,
-    "error": logging.ERROR
+    "info": INFO,
+    "debug": DEBUG,
+    "warning": WARNING,
+    "error": ERROR
 }
 
+_executor: Optional['ThreadPoolExecutor'] = None
+_executor_lock = threading.Lock()
+# triggerId -> alerts waiting behind the send already running for that trigger
+_pending: Dict[str, Deque[Dict[str, str]]] = {}
+
+def _get_executor() -> 'ThreadPoolExecutor':
+    """Return the background send pool, creating it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="send2jsm")
+            # Queued posts still go out before the process exits
+            atexit.register(_executor.shutdown, wait=True)
+        return _executor
+
+def wait_for_sends() -> None:
+    """Stop taking background sends and block until the queued ones are done"""
+    with _executor_lock:
+        executor = _executor
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+def _read_config_cache(cache_path: str, key: tuple) -> Optional[Dict[str, str]]:
+    """Return the cached config if it was written for key, else None"""
+    try:
+        with open(cache_path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            # Only trust a cache we wrote ourselves and nobody else can modify
+            if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                return None
+            cached_key, config = pickle.load(f)
+    except Exception:
+        return None
+    return config if cached_key == key else None
+
+def _write_config_cache(cache_path: str, key: tuple, config: Dict[str, str]) -> None:
+    """Atomically replace the config cache; failures only cost the next run a re-parse"""
+    tmp_path = f"{cache_path}.{os.getpid()}"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
 class ConfigurationError(Exception):
     """Custom exception for configuration errors"""
     pass
@@ -63,6 +132,8 @@ class Configuration:
 
     @classmethod
     def from_json(cls, filepath: str) -> 'Configuration':
+        import json
+
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
@@ -81,30 +152,61 @@ class JSMClient:
         self.config = DEFAULT_CONFIG.copy()
         self.parameters: Dict[str, str] = {}
         self.total_time = 60
-        self.logger = None
+        # Replaced by the log file in _setup_logging, once the config is known
+        self.logger = FastLog()
+        self._https_proxy_warned = False
         
+        self.config = self._load_cached_config(config_path, jec_config_path).copy()
+        self.total_time = max(1, int(self.config["timeout"]))
+        # Per-attempt timeouts grow linearly and add up to total_time
+        self._timeouts = tuple(max(1, int(self.total_time * attempt / 6)) for attempt in range(1, MAX_ATTEMPTS + 1))
+        self._setup_logging()
+
+    def _load_cached_config(self, config_path: str, jec_config_path: str) -> Dict[str, str]:
+        """Load both config files, reusing the on-disk cache while neither has changed"""
+        try:
+            key = (config_path, os.stat(config_path).st_mtime_ns,
+                   jec_config_path, os.stat(jec_config_path).st_mtime_ns)
+        except OSError:
+            key = None  # Let the loaders below report the missing file
+
+        cache_path = CONFIG_CACHE_PATH.format(uid=os.getuid())
+        if key is not None:
+            cached = _read_config_cache(cache_path, key)
+            if cached is not None:
+                # A cache written by an older version may lack newer default keys
+                return {**DEFAULT_CONFIG, **cached}
+
         self._load_config(config_path)
         self._load_jec_config(jec_config_path)
-        self._setup_logging()
+        if key is not None:
+            _write_config_cache(cache_path, key, self.config)
+        return self.config
 
     def _load_config(self, config_path: str) -> None:
         try:
-            with open(config_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        try:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            self.config[key] = value
-                            if key == "timeout":
-                                self.total_time = max(1, int(value))
-                        except ValueError:
-                            self.logger.warning(f"Invalid line in config file: {line}")
+            text = Path(config_path).read_text()
         except Exception as e:
             raise ConfigurationError(f"Error reading config file: {e}")
 
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line or line[0] == '#':
+                continue
+            key, sep, value = line.partition('=')
+            if not sep:
+                self.logger.warning("Invalid line in config file: %s", line)
+                continue
+            key = key.strip()
+            value = value.strip()
+            if key == "timeout":
+                try:
+                    self.total_time = max(1, int(value))
+                except ValueError:
+                    self.logger.warning("Invalid line in config file: %s", line)
+                    continue
+            self.config[key] = value
+
     def _load_jec_config(self, jec_config_path: str) -> None:
         try:
             jec_config = Configuration.from_json(jec_config_path)
@@ -116,171 +218,298 @@ class JSMClient:
             raise ConfigurationError(f"Error reading JEC config file: {e}")
 
     def _setup_logging(self) -> None:
-        log_level = LOG_LEVELS.get(self.config["zabbix2jsm.logger"].lower(), logging.WARNING)
-        log_path = self.parameters.get("logPath", "/var/log/jec/send2jsm.log")
-        log_dir = os.path.dirname(log_path)
-
-        try:
-            # Check if directory exists and is writable
-            if not os.path.exists(log_dir):
-                Path(log_dir).mkdir(parents=True, exist_ok=True)
-            
-            if not os.access(log_dir, os.W_OK):
-                raise PermissionError(f"No write permission for log directory: {log_dir}")
-
-            logging.basicConfig(
-                filename=log_path,
-                level=log_level,
-                format='%(asctime)s - %(levelname)s - %(message)s'
-            )
-        except Exception as e:
-            print(f"Could not create log file '{log_path}', will log to '/tmp/send2jsm.log'. Error: {e}")
-            try:
-                logging.basicConfig(
-                    filename="/tmp/send2jsm.log",
-                    level=log_level,
-                    format='%(asctime)s - %(levelname)s - %(message)s'
-                )
-            except Exception as e:
-                print(f"Logging disabled. Reason: {e}")
-
-        self.logger = logging.getLogger(__name__)
-
-    def _get_http_client(self, timeout: int) -> requests.Session:
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
+        log_level = LOG_LEVELS.get(self.config["zabbix2jsm.logger"].lower(), WARNING)
+        log_path = self.parameters.get("logPath", DEFAULT_LOG_PATH)
+        self.logger = FastLog(configure_once(log_path), log_level)
+
+    def _get_proxy(self, url: SplitResult) -> Optional[Tuple[str, int, str, str]]:
+        """Return (host, port, username, password) of the proxy to use for url, if any.
+
+        The zabbix2jsm.http.proxy.* settings take precedence; otherwise the
+        standard HTTP(S)_PROXY / NO_PROXY environment variables apply, as
+        they did with requests. The tunnel is always a CONNECT over plain
+        TCP; https proxies are treated the same way, as urllib3 < 1.26 did.
+        Other protocols raise ConfigurationError, a bad port ValueError.
+        """
         if self.config["zabbix2jsm.http.proxy.enabled"].lower() == "true":
-            proxy_host = self.config["zabbix2jsm.http.proxy.host"]
-            proxy_port = self.config["zabbix2jsm.http.proxy.port"]
-            proxy_protocol = self.config["zabbix2jsm.http.proxy.protocol"]
-            proxy_username = self.config["zabbix2jsm.http.proxy.username"]
-            proxy_password = self.config["zabbix2jsm.http.proxy.password"]
-
-            proxy_url = f"{proxy_protocol}://{proxy_host}:{proxy_port}"
-            if proxy_username and proxy_password:
-                proxy_url = f"{proxy_protocol}://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
+            protocol = self.config["zabbix2jsm.http.proxy.protocol"].lower()
+            host = self.config["zabbix2jsm.http.proxy.host"]
+            port = self.config["zabbix2jsm.http.proxy.port"]
+            username = self.config["zabbix2jsm.http.proxy.username"]
+            password = self.config["zabbix2jsm.http.proxy.password"]
+        else:
+            import urllib.request
+
+            proxy_url = urllib.request.getproxies().get(url.scheme)
+            if not proxy_url or urllib.request.proxy_bypass(url.hostname):
+                return None
+            if "://" not in proxy_url:
+                proxy_url = f"http://{proxy_url}"
+            proxy = urlsplit(proxy_url)
+            protocol = proxy.scheme.lower()
+            host = proxy.hostname
+            port = proxy.port or (443 if protocol == "https" else 80)
+            username = unquote(proxy.username or "")
+            password = unquote(proxy.password or "")
+
+        if protocol == "https":
+            if not self._https_proxy_warned:
+                self._https_proxy_warned = True
+                self.logger.warning("https proxy %s: connecting to it without TLS (CONNECT over plain TCP)", host)
+        elif protocol != "http":
+            raise ConfigurationError(
+                f"Unsupported proxy protocol '{protocol}': only http and https proxies are supported")
+        try:
+            port = int(port)
+        except ValueError:
+            raise ValueError(f"Invalid proxy port: {port!r}") from None
+        return host, port, username, password
+
+    def _get_http_client(self, url: SplitResult) -> 'http.client.HTTPConnection':
+        """Return a connection to the JSM API, tunnelled through the proxy if one applies"""
+        import base64
+        import http.client
+        import ssl
+
+        if url.scheme == "https":
+            # Certificates are not verified, as before with verify=False
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            connection_class = functools.partial(http.client.HTTPSConnection, context=context)
+        else:
+            connection_class = http.client.HTTPConnection
+
+        proxy = self._get_proxy(url)
+        if proxy is None:
+            return connection_class(url.hostname, url.port, timeout=self._timeouts[0])
+
+        proxy_host, proxy_port, proxy_username, proxy_password = proxy
+        proxy_headers = {}
+        if proxy_username and proxy_password:
+            credentials = base64.b64encode(f"{proxy_username}:{proxy_password}".encode()).decode()
+            proxy_headers["Proxy-Authorization"] = f"Basic {credentials}"
+
+        connection = connection_class(proxy_host, proxy_port, timeout=self._timeouts[0])
+        connection.set_tunnel(url.hostname, url.port, headers=proxy_headers)
+        return connection
+
+    def _validate_response(self, response: 'http.client.HTTPResponse') -> bool:
+        """Validate the response from the server"""
+        # Only the status matters; nobody uses the body, so don't parse it.
+        if 200 <= response.status < 300:
+            return True
+        if 300 <= response.status < 400:
+            # Redirects are not followed: re-posting the alert elsewhere is
+            # not something to do silently, so point at the config instead.
+            self.logger.error("Redirected (%s) to %s; update jsm.api.url in jec-config.json",
+                              response.status, response.getheader("Location"))
+            return False
+        self.logger.error("HTTP error occurred: %s %s", response.status, response.reason)
+        return False
 
-            session.proxies = {
-                "http": proxy_url,
-                "https": proxy_url
-            }
+    def check_send_config(self) -> None:
+        """Raise ConfigurationError if send_data could not deliver with this configuration.
 
-        return session
+        send_data only runs into these when posting; a long-running sender
+        checks them up front instead of failing every alert.
+        """
+        if not self.config["apiKey"]:
+            raise ConfigurationError("API key is not configured")
+        try:
+            self._get_proxy(urlsplit(self.config["jsm.api.url"]))
+        except ValueError as e:
+            raise ConfigurationError(str(e)) from None
+
+    def send_data_async(self, parameters: Optional[Dict[str, str]] = None) -> None:
+        """Queue send_data on a background thread.
+
+        Alerts for one triggerId are posted one at a time and in arrival
+        order, by a single task draining that trigger's queue, so a burst
+        for one trigger only ever occupies one worker. Failures only go to
+        the log.
+        """
+        if not self.config["apiKey"]:
+            raise ConfigurationError("API key is not configured")
+        parameters = dict(self.parameters if parameters is None else parameters)
+
+        trigger_id = parameters.get("triggerId")
+        if not trigger_id:
+            _get_executor().submit(self._send_logged, parameters)
+            return
+        with _executor_lock:
+            queue = _pending.get(trigger_id)
+            if queue is not None:
+                queue.append(parameters)
+                return
+            _pending[trigger_id] = collections.deque()
+        try:
+            _get_executor().submit(self._drain_trigger, trigger_id, parameters)
+        except BaseException:
+            # Nothing will drain this queue; don't let later alerts pile up in it
+            with _executor_lock:
+                del _pending[trigger_id]
+            raise
+
+    def _drain_trigger(self, trigger_id: str, parameters: Dict[str, str]) -> None:
+        while True:
+            self._send_logged(parameters)
+            with _executor_lock:
+                queue = _pending[trigger_id]
+                if not queue:
+                    del _pending[trigger_id]
+                    return
+                parameters = queue.popleft()
 
-    def _validate_response(self, response: requests.Response) -> bool:
-        """Validate the response from the server"""
+    def _send_logged(self, parameters: Dict[str, str]) -> None:
         try:
-            response.raise_for_status()
-            response.json()  # Validate JSON response
-            return True
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error occurred: {e}")
-            return False
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON response: {e}")
-            return False
+            self.send_data(parameters)
+        except SystemExit:
+            pass  # send_data already logged that every attempt failed
         except Exception as e:
-            self.logger.error(f"Unexpected error validating response: {e}")
-            return False
+            self.logger.error("Unexpected error sending alert: %s", e)
+        finally:
+            self.logger.flush()
 
-    def send_data(self) -> None:
+    def send_data(self, parameters: Optional[Dict[str, str]] = None) -> None:
+        """Post parameters (self.parameters by default) to JSM.
+
+        The client itself is not modified, so one instance can serve
+        concurrent sends (see send2jsmd.py).
+        """
         if not self.config["apiKey"]:
             raise ConfigurationError("API key is not configured")
 
-        self.parameters["apiKey"] = self.config["apiKey"]
-        log_prefix = f"[TriggerId: {self.parameters.get('triggerId', '')}, HostName: {self.parameters.get('hostName', '')}]"
+        parameters = dict(self.parameters if parameters is None else parameters)
+        parameters["apiKey"] = self.config["apiKey"]
+        log_prefix = f"[TriggerId: {parameters.get('triggerId', '')}, HostName: {parameters.get('hostName', '')}]"
         
         api_url = f"{self.config['jsm.api.url']}/jsm/ops/integration/v1/json/zabbix"
         target = "JSM"
 
-        self.logger.debug(f"URL: {api_url}")
-        # Mask sensitive data in logs
-        safe_params = {k: '*******' if 'password' in k or 'key' in k else v 
-                      for k, v in self.parameters.items()}
-        self.logger.debug(f"Data to be posted: {safe_params}")
-
-        for attempt in range(1, 4):
-            timeout = max(1, (self.total_time / 12) * 2 * attempt)
-            self.logger.debug(f"{log_prefix} Trying to send data to {target} with timeout: {timeout}")
-
-            try:
-                session = self._get_http_client(attempt)
-                response = session.post(
-                    api_url,
-                    json=self.parameters,
-                    verify=False,
-                    timeout=timeout
-                )
+        debug = self.logger.isEnabledFor(DEBUG)
+        self.logger.debug("URL: %s", api_url)
+        if debug:
+            # Mask sensitive data in logs
+            safe_params = {k: '*******' if 'password' in k or 'key' in k else v 
+                          for k, v in parameters.items()}
+            self.logger.debug("Data to be posted: %s", safe_params)
 
-                if self._validate_response(response):
-                    self.logger.debug(f"{log_prefix} Response code: {response.status_code}")
-                    self.logger.debug(f"{log_prefix} Response: {response.text}")
-                    self.logger.info(f"{log_prefix} Data from Zabbix posted to {target} successfully")
-                    return
-                else:
-                    self.logger.error(f"{log_prefix} Failed to post data. Status code: {response.status_code}")
-                    self.logger.error(f"{log_prefix} Response: {response.text}")
-
-            except Timeout:
-                self.logger.error(f"{log_prefix} Request timed out")
-                if attempt == 3:
-                    self.logger.error(f"{log_prefix} All attempts failed to send data to {target}")
-                    sys.exit(1)
-            except ConnectionError:
-                self.logger.error(f"{log_prefix} Connection error occurred")
-                if attempt == 3:
-                    self.logger.error(f"{log_prefix} All attempts failed to send data to {target}")
-                    sys.exit(1)
-            except Exception as e:
-                self.logger.error(f"{log_prefix} Error occurred while sending data: {str(e)}")
-                if attempt == 3:
-                    self.logger.error(f"{log_prefix} All attempts failed to send data to {target}")
-                    sys.exit(1)
-            time.sleep(1)
+        import http.client
+        import json
+        import socket
+
+        # Serialize once; every attempt resends these bytes as-is
+        body = json.dumps(parameters, separators=(',', ':'), allow_nan=False).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+
+        url = urlsplit(api_url)
+        path = f"{url.path}?{url.query}" if url.query else url.path
+        try:
+            connection = self._get_http_client(url)
+        except ValueError as e:
+            self.logger.error("%s Error occurred while sending data: %s", log_prefix, e)
+            self.logger.error("%s All attempts failed to send data to %s", log_prefix, target)
+            sys.exit(1)
+        try:
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                timeout = self._timeouts[attempt - 1]
+                self.logger.debug("%s Trying to send data to %s with timeout: %s", log_prefix, target, timeout)
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                try:
+                    connection.request('POST', path, body=body, headers=headers)
+                    response = connection.getresponse()
+                    response_text = response.read().decode('utf-8', 'replace')
+                    if response.status not in RETRY_STATUSES or attempt == MAX_ATTEMPTS:
+                        break
+                    self.logger.warning("%s %s returned status %s, retrying", log_prefix, target, response.status)
+                except (OSError, http.client.HTTPException) as e:
+                    # Drop the broken connection; the next request reconnects
+                    connection.close()
+                    if isinstance(e, socket.timeout):
+                        self.logger.error("%s Request timed out", log_prefix)
+                    elif isinstance(e, ConnectionError):
+                        self.logger.error("%s Connection error occurred", log_prefix)
+                    else:
+                        self.logger.error("%s Error occurred while sending data: %s", log_prefix, e)
+                    if attempt == MAX_ATTEMPTS:
+                        self.logger.error("%s All attempts failed to send data to %s", log_prefix, target)
+                        sys.exit(1)
+                time.sleep(attempt)
+        finally:
+            connection.close()
+
+        if self._validate_response(response):
+            if debug:
+                self.logger.debug("%s Response code: %s", log_prefix, response.status)
+                self.logger.debug("%s Response: %s", log_prefix, response_text)
+            self.logger.info("%s Data from Zabbix posted to %s successfully", log_prefix, target)
+        else:
+            self.logger.error("%s Failed to post data. Status code: %s", log_prefix, response.status)
+            self.logger.error("%s Response: %s", log_prefix, response_text)
+
+def _usage_error(message: str) -> None:
+    """Report a command line error the way argparse does"""
+    prog = os.path.basename(sys.argv[0])
+    print(f"usage: {prog} [--name value ...]\n{prog}: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+def parse_options(argv: List[str], allowed: Iterable[str], required: Iterable[str] = ()) -> Dict[str, str]:
+    """Parse `--name value` / `--name=value` pairs without the cost of argparse"""
+    allowed = set(allowed)
+    options = {}
+    args = iter(argv)
+    for arg in args:
+        name, sep, value = arg.partition('=')
+        key = name[2:] if name.startswith('--') else None
+        if key not in allowed:
+            _usage_error(f"unrecognized arguments: {arg}")
+        if not sep:
+            value = next(args, None)
+            if value is None:
+                _usage_error(f"argument {name}: expected one argument")
+        options[key] = value
+
+    missing = [f"--{key}" for key in required if key not in options]
+    if missing:
+        _usage_error(f"the following arguments are required: {', '.join(missing)}")
+    return options
 
 def parse_args() -> Dict[str, str]:
-    parser = argparse.ArgumentParser(description='Send data to JSM')
-    parser.add_argument('-v', '--version', action='store_true', help='Show version')
-    
-    # Add all other parameters as arguments
-    for key in DEFAULT_CONFIG.keys():
-        parser.add_argument(f'--{key}', help=f'Set {key}')
-    
-    args = parser.parse_args()
-    
-    if args.version:
+    argv = sys.argv[1:]
+    if '-v' in argv or '--version' in argv:
         print("Version: 1.1")
         sys.exit(0)
-    
-    return {k: v for k, v in vars(args).items() if v is not None}
+
+    return parse_options(argv, DEFAULT_CONFIG.keys())
+
+# str.translate table deleting every ASCII character that is not a letter or digit
+_SPECIAL_CHARS = {c: None for c in range(128) if chr(c) not in string.ascii_letters + string.digits}
 
 def remove_special_characters(param: str) -> str:
+    if param.isascii():
+        return param.translate(_SPECIAL_CHARS)
     return re.sub(r'[^a-zA-Z0-9]', '', param)
 
 def main():
     try:
-        client = JSMClient()
+        # Parse arguments first so --version doesn't load any configuration
         parameters = parse_args()
+        client = JSMClient()
         
         # Update parameters with command line arguments
         client.parameters.update(parameters)
         
         # Print configuration to log
-        if client.logger and client.logger.isEnabledFor(logging.DEBUG):
+        if client.logger and client.logger.isEnabledFor(DEBUG):
             client.logger.debug("Config:")
             for k, v in client.config.items():
                 if "password" in k or "key" in k:
-                    client.logger.debug(f"{k}=*******")
+                    client.logger.debug("%s=*******", k)
                 else:
-                    client.logger.debug(f"{k}={v}")
+                    client.logger.debug("%s=%s", k, v)
         
         client.send_data()
     except ConfigurationError as e:
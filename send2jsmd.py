@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Long-running sender for Zabbix alerts.
+
+Keeps one JSMClient (parsed configuration, open log file) for the life of
+the process and posts every alert received on a Unix socket, so wrappers
+don't pay for interpreter start-up and config parsing per alert. Restart
+the daemon after changing integration.conf or jec-config.json. On SIGTERM
+or SIGINT it stops accepting and sends every acknowledged alert before
+exiting.
+"""
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+
+from send2jsm import DAEMON_SOCKET_PATH, MAX_ALERT_SIZE, ConfigurationError, JSMClient, parse_options, wait_for_sends
+
+CLIENT_TIMEOUT = 5
+# How often the accept loop checks for a stop request
+ACCEPT_TIMEOUT = 1
+
+def _receive_alert(conn: socket.socket) -> dict:
+    data, _, flags, _ = conn.recvmsg(MAX_ALERT_SIZE)
+    # recv() would silently drop the rest of an oversized message
+    if flags & socket.MSG_TRUNC:
+        raise ValueError(f"alert is larger than {MAX_ALERT_SIZE} bytes")
+    alert = json.loads(data)
+    if not isinstance(alert, dict):
+        raise ValueError("alert is not a JSON object")
+    return alert
+
+def _handle(client: JSMClient, conn: socket.socket) -> None:
+    with conn:
+        # OK once queued; the post itself happens in the background.
+        # ERR tells the wrapper to send the alert directly instead.
+        reply = b"ERR"
+        try:
+            conn.settimeout(CLIENT_TIMEOUT)
+            alert = _receive_alert(conn)
+        except (OSError, ValueError) as e:
+            client.logger.error("Rejected alert: %s", e)
+        else:
+            try:
+                client.send_data_async(alert)
+                reply = b"OK"
+            except Exception as e:
+                client.logger.error("Could not queue alert: %s", e)
+        try:
+            conn.send(reply)
+        except OSError:
+            pass
+
+def serve(client: JSMClient, socket_path: str, stop: threading.Event) -> None:
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET) as server:
+        server.bind(socket_path)
+        os.chmod(socket_path, 0o660)
+        server.listen()
+        server.settimeout(ACCEPT_TIMEOUT)
+        client.logger.info("Listening on %s", socket_path)
+        client.logger.flush()
+
+        while not stop.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            _handle(client, conn)
+
+        # New wrappers now find no daemon and send directly
+        try:
+            os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+        # Wrappers already in the backlog connected in time; take their alerts too
+        server.setblocking(False)
+        while True:
+            try:
+                conn, _ = server.accept()
+            except BlockingIOError:
+                break
+            _handle(client, conn)
+
+def main():
+    options = parse_options(sys.argv[1:], ("socket",))
+    try:
+        client = JSMClient()
+        client.check_send_config()
+    except ConfigurationError as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+
+    serve(client, options.get("socket", DAEMON_SOCKET_PATH), stop)
+
+    client.logger.info("Stopping; waiting for queued alerts")
+    wait_for_sends()
+    client.logger.flush()
+
+if __name__ == "__main__":
+    main()